@@ -0,0 +1,149 @@
+"""
+_fast.py
+--------
+Compiled kernels for the hot aggregation paths in business_metrics.
+
+Numba is optional: without it the same results are produced with np.bincount.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional dependency
+    njit = None
+
+
+def _agg_by_code_numpy(codes: np.ndarray, values: np.ndarray, ngroups: int):
+    """np.bincount fallback for agg_by_code."""
+    valid = codes >= 0
+    codes = codes[valid]
+    values = np.nan_to_num(values[valid], nan=0.0)
+    totals = np.bincount(codes, weights=values, minlength=ngroups)
+    counts = np.bincount(codes, minlength=ngroups)
+    return totals, counts
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _agg_by_code_jit(codes, values, ngroups):
+        totals = np.zeros(ngroups)
+        counts = np.zeros(ngroups, np.int64)
+        for i in range(codes.size):
+            g = codes[i]
+            if g < 0:
+                continue
+            counts[g] += 1
+            v = values[i]
+            if v == v:  # skip NaN, matching pandas sum
+                totals[g] += v
+        return totals, counts
+
+    _agg_by_code = _agg_by_code_jit
+else:
+    _agg_by_code = _agg_by_code_numpy
+
+
+def agg_by_code(codes: np.ndarray, values: np.ndarray, ngroups: int):
+    """
+    Sum values and count rows per integer group code in a single pass.
+
+    Parameters
+    ----------
+    codes : np.ndarray of int
+        Group code per row (e.g. Categorical codes); -1 marks a missing key and is skipped.
+    values : np.ndarray of float64
+        Value per row; NaN values are left out of the sum but the row is still counted.
+    ngroups : int
+        Number of groups (length of the output arrays).
+
+    Returns
+    -------
+    (totals, counts) : tuple of np.ndarray (float64, int64), one entry per group
+    """
+    return _agg_by_code(codes, values, ngroups)
+
+
+def _delivery_stats_numpy(days: np.ndarray, scores: np.ndarray, edges: np.ndarray):
+    """searchsorted/bincount fallback for delivery_stats."""
+    nbuckets = edges.size + 1
+    has_days = ~np.isnan(days)
+    has_score = ~np.isnan(scores)
+
+    codes = np.searchsorted(edges, days[has_days], side='left')
+    bucket_scores = scores[has_days]
+    bucket_scored = has_score[has_days]
+    order_count = np.bincount(codes, minlength=nbuckets)
+    score_sum = np.bincount(codes[bucket_scored], weights=bucket_scores[bucket_scored],
+                            minlength=nbuckets)
+    score_n = np.bincount(codes[bucket_scored], minlength=nbuckets)
+
+    return (
+        score_sum, score_n, order_count,
+        days[has_days].sum(), int(has_days.sum()),
+        scores[has_score].sum(), int(has_score.sum()),
+    )
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _delivery_stats_jit(days, scores, edges):
+        nbuckets = edges.size + 1
+        score_sum = np.zeros(nbuckets)
+        score_n = np.zeros(nbuckets, np.int64)
+        order_count = np.zeros(nbuckets, np.int64)
+        days_sum = 0.0
+        days_n = 0
+        total_score = 0.0
+        total_n = 0
+        for i in range(days.size):
+            d = days[i]
+            r = scores[i]
+            has_score = r == r
+            if has_score:
+                total_score += r
+                total_n += 1
+            if d != d:
+                continue
+            days_sum += d
+            days_n += 1
+            b = 0
+            while b < edges.size and d > edges[b]:
+                b += 1
+            order_count[b] += 1
+            if has_score:
+                score_sum[b] += r
+                score_n[b] += 1
+        return score_sum, score_n, order_count, days_sum, days_n, total_score, total_n
+
+    _delivery_stats = _delivery_stats_jit
+else:
+    _delivery_stats = _delivery_stats_numpy
+
+
+def delivery_stats(days: np.ndarray, scores: np.ndarray, edges: np.ndarray):
+    """
+    Bucket delivery durations and accumulate review statistics in a single pass.
+
+    A duration d falls in bucket b when edges[b-1] < d <= edges[b]
+    (np.searchsorted side='left'); durations above the last edge go in the
+    final bucket. NaN durations are left out of every bucket and of the
+    delivery-day totals; NaN scores are left out of every score sum.
+
+    Parameters
+    ----------
+    days : np.ndarray of float64
+        Delivery days per order.
+    scores : np.ndarray of float64
+        Review score per order.
+    edges : np.ndarray of float64
+        Ascending upper bucket edges (len(edges) + 1 buckets).
+
+    Returns
+    -------
+    (score_sum, score_n, order_count, days_sum, days_n, total_score, total_n)
+        Per-bucket score sums, scored-order counts and order counts, followed
+        by the delivery-day sum/count and the review-score sum/count over all
+        orders.
+    """
+    return _delivery_stats(days, scores, edges)
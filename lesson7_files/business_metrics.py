@@ -13,12 +13,27 @@ Metrics covered
 - Customer exp. : review score distribution, delivery speed analysis
 """
 
+import os
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.ticker as mticker
 import plotly.express as px
 
+from _fast import agg_by_code, delivery_stats
+
+# Set SCCLAUDE_BACKEND=polars to run the aggregations on Polars (if installed);
+# results are returned as pandas DataFrames either way. Polars is only imported
+# when selected here or when compute_all_metrics_lazy is called.
+pl = None
+if os.environ.get('SCCLAUDE_BACKEND', 'pandas').lower() == 'polars':
+    try:
+        import polars as pl
+    except ImportError:  # optional backend
+        pass
+USE_POLARS = pl is not None
+
 # ---------------------------------------------------------------------------
 # Shared style constants
 # ---------------------------------------------------------------------------
@@ -30,6 +45,9 @@ NEG_COLOR       = '#C0392B'   # red        – negative values
 POS_COLOR       = '#27AE60'   # green      – positive values
 GRID_COLOR      = '#E8E8E8'
 
+# Bar colour per review score (1-5)
+_REVIEW_COLORS = {1: NEG_COLOR, 2: NEG_COLOR, 3: ACCENT_COLOR, 4: SECONDARY_COLOR, 5: PRIMARY_COLOR}
+
 FIGURE_SIZE_WIDE = (12, 5)
 FIGURE_SIZE_SQ   = (10, 6)
 
@@ -45,6 +63,76 @@ def _apply_base_style(ax, title: str, xlabel: str = '', ylabel: str = '') -> Non
         ax.spines[spine].set_visible(False)
 
 
+def _ensure_categorical(col: pd.Series) -> pd.Series:
+    """Return a grouping key as a categorical Series (no-op if it already is one)."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return col
+    return col.astype('category')
+
+
+def _price_totals(codes: np.ndarray, sales: pd.DataFrame, ngroups: int):
+    """
+    Sum 'price' per integer group code with agg_by_code.
+
+    float32 prices are passed to the kernel without upcasting (it accumulates
+    in float64), and totals are rounded to cents to drop float32 storage noise.
+
+    Returns
+    -------
+    (totals, counts) : tuple of np.ndarray, one entry per group
+    """
+    price = sales['price']
+    dtype = price.dtype if price.dtype == np.float32 else np.float64
+    totals, counts = agg_by_code(codes, price.to_numpy(dtype=dtype, na_value=np.nan), ngroups)
+    return np.round(totals, 2), counts
+
+
+def _sum_price_by_category(
+    sales: pd.DataFrame, key: pd.Series
+) -> tuple[np.ndarray, pd.Categorical]:
+    """
+    Sum 'price' per category of a categorical key, keeping only observed categories.
+
+    Returns the revenue per observed category and those categories as a
+    Categorical with the key's dtype.
+    """
+    categories = key.cat.categories
+    totals, counts = _price_totals(key.cat.codes.to_numpy(), sales, len(categories))
+    seen = np.flatnonzero(counts)
+    return totals[seen], pd.Categorical.from_codes(seen, dtype=key.dtype)
+
+
+def _month_codes(sales: pd.DataFrame) -> np.ndarray:
+    """purchase_month as group codes for agg_by_code: 1-12, or -1 where the month is missing."""
+    return sales['purchase_month'].to_numpy(dtype=np.intp, na_value=-1)
+
+
+ORDER_LEVEL_COLUMNS = ['order_id', 'customer_state', 'delivery_days', 'review_score']
+
+
+def build_order_level(sales: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reduce a line-item sales frame to one row per order.
+
+    Compute this once per sales frame and pass it to the order-level metric
+    functions (geographic order counts, delivery, review distribution) so
+    order_id is deduplicated only once.
+
+    Parameters
+    ----------
+    sales : pd.DataFrame
+        Must contain 'order_id'; the other ORDER_LEVEL_COLUMNS are carried
+        over when present.
+
+    Returns
+    -------
+    pd.DataFrame with the ORDER_LEVEL_COLUMNS found in sales
+    (at most: order_id, customer_state, delivery_days, review_score)
+    """
+    columns = [col for col in ORDER_LEVEL_COLUMNS if col in sales]
+    return sales.loc[~sales['order_id'].duplicated(), columns]
+
+
 # ===========================================================================
 # 1. Revenue Metrics
 # ===========================================================================
@@ -78,33 +166,74 @@ def calculate_revenue_metrics(
         aov_{current_year}, aov_{comparison_year},
         aov_growth_pct
     """
-    rev_cur  = current_sales['price'].sum()
-    rev_comp = comparison_sales['price'].sum()
+    # One groupby over both frames instead of a separate pass per frame; the
+    # frames are keyed by position, since the two year labels may be equal
+    by_year = (
+        _combined(current_sales, comparison_sales, ['order_id', 'price'])
+        .groupby('_y', sort=False)
+        .agg(revenue=('price', 'sum'), orders=('order_id', 'nunique'))
+        .reindex([0, 1], fill_value=0)
+    )
+    rev_cur, rev_comp = by_year['revenue'].tolist()
+    orders_cur, orders_comp = by_year['orders'].tolist()
+    return _revenue_kpis(current_year, comparison_year, rev_cur, rev_comp, orders_cur, orders_comp)
 
-    orders_cur  = current_sales['order_id'].nunique()
-    orders_comp = comparison_sales['order_id'].nunique()
 
-    aov_cur  = current_sales.groupby('order_id')['price'].sum().mean()
-    aov_comp = comparison_sales.groupby('order_id')['price'].sum().mean()
+def _revenue_kpis(
+    current_year: int,
+    comparison_year: int,
+    rev_cur: float,
+    rev_comp: float,
+    orders_cur: int,
+    orders_comp: int,
+) -> dict:
+    """Build the calculate_revenue_metrics() dict from per-year revenue and order totals."""
+    # AOV is revenue per distinct order, so no per-order groupby is needed
+    aov_cur  = rev_cur / orders_cur if orders_cur else np.nan
+    aov_comp = rev_comp / orders_comp if orders_comp else np.nan
 
     def pct_change(new, old):
-        return ((new - old) / old * 100) if old else None
+        # None when there is nothing to compare against (no comparison data)
+        if not old or np.isnan(old):
+            return None
+        return round((new - old) / old * 100, 2)
 
     return {
         'current_year':   current_year,
         'comparison_year': comparison_year,
         f'total_revenue_{current_year}':    round(rev_cur, 2),
         f'total_revenue_{comparison_year}': round(rev_comp, 2),
-        'revenue_growth_pct': round(pct_change(rev_cur, rev_comp), 2),
+        'revenue_growth_pct': pct_change(rev_cur, rev_comp),
         f'total_orders_{current_year}':    orders_cur,
         f'total_orders_{comparison_year}': orders_comp,
-        'order_growth_pct': round(pct_change(orders_cur, orders_comp), 2),
+        'order_growth_pct': pct_change(orders_cur, orders_comp),
         f'aov_{current_year}':    round(aov_cur, 2),
         f'aov_{comparison_year}': round(aov_comp, 2),
-        'aov_growth_pct': round(pct_change(aov_cur, aov_comp), 2),
+        'aov_growth_pct': pct_change(aov_cur, aov_comp),
     }
 
 
+def _combined(
+    current: pd.DataFrame,
+    comparison: pd.DataFrame,
+    columns: list[str],
+) -> pd.DataFrame:
+    """
+    Stack two sales frames with a '_y' key (0 = current, 1 = comparison) so both
+    aggregate in one groupby.
+
+    'price' is upcast to float64 so the groupby sums accumulate at full precision.
+    """
+    frames = [
+        current[columns].assign(_y=0),
+        comparison[columns].assign(_y=1),
+    ]
+    both = pd.concat(frames)
+    if 'price' in columns:
+        both['price'] = both['price'].astype(np.float64)
+    return both
+
+
 def calculate_monthly_revenue(sales: pd.DataFrame) -> pd.DataFrame:
     """
     Compute monthly revenue totals and month-over-month percentage change.
@@ -118,13 +247,14 @@ def calculate_monthly_revenue(sales: pd.DataFrame) -> pd.DataFrame:
     -------
     pd.DataFrame with columns: purchase_month, revenue, mom_growth_pct
     """
-    monthly = (
-        sales.groupby('purchase_month')['price']
-        .sum()
-        .reset_index()
-        .rename(columns={'price': 'revenue'})
-        .sort_values('purchase_month')
-    )
+    if USE_POLARS:
+        return _monthly_revenue_polars(sales)
+
+    # Months are 1-12, so they index a 13-slot accumulator directly; rows with
+    # no purchase month get code -1, which the accumulator skips
+    revenue, counts = _price_totals(_month_codes(sales), sales, 13)
+    seen = np.flatnonzero(counts)
+    monthly = pd.DataFrame({'purchase_month': seen, 'revenue': revenue[seen]})
     monthly['mom_growth_pct'] = monthly['revenue'].pct_change() * 100
     return monthly
 
@@ -148,22 +278,31 @@ def calculate_product_metrics(sales: pd.DataFrame) -> pd.DataFrame:
         product_category_name, revenue, market_share_pct
         sorted descending by revenue.
     """
-    cat = (
-        sales.groupby('product_category_name')['price']
-        .sum()
-        .reset_index()
-        .rename(columns={'price': 'revenue'})
-        .sort_values('revenue', ascending=False)
-    )
-    cat['market_share_pct'] = (cat['revenue'] / cat['revenue'].sum() * 100).round(2)
-    return cat.reset_index(drop=True)
+    if USE_POLARS:
+        return _product_metrics_polars(sales)
+
+    category = _ensure_categorical(sales['product_category_name'])
+    revenue, observed = _sum_price_by_category(sales, category)
+    total = revenue.sum()
+    # No revenue at all (empty or all-NaN prices): every share is 0 rather than 0/0
+    share = np.round(revenue * (100.0 / total), 2) if total else np.zeros_like(revenue)
+
+    order = np.argsort(-revenue, kind='stable')
+    return pd.DataFrame({
+        'product_category_name': observed[order],
+        'revenue':               revenue[order],
+        'market_share_pct':      share[order],
+    })
 
 
 # ===========================================================================
 # 3. Geographic Metrics
 # ===========================================================================
 
-def calculate_geographic_metrics(sales: pd.DataFrame) -> pd.DataFrame:
+def calculate_geographic_metrics(
+    sales: pd.DataFrame,
+    order_level: pd.DataFrame | None = None,
+) -> pd.DataFrame:
     """
     Revenue, order count, and average order value by US state.
 
@@ -171,6 +310,8 @@ def calculate_geographic_metrics(sales: pd.DataFrame) -> pd.DataFrame:
     ----------
     sales : pd.DataFrame
         Must contain 'customer_state', 'order_id', and 'price'.
+    order_level : pd.DataFrame or None
+        Output of build_order_level(sales), if already computed.
 
     Returns
     -------
@@ -178,31 +319,56 @@ def calculate_geographic_metrics(sales: pd.DataFrame) -> pd.DataFrame:
         customer_state, revenue, order_count, aov
         sorted descending by revenue.
     """
-    geo = (
-        sales.groupby('customer_state')
-        .agg(
-            revenue=('price', 'sum'),
-            order_count=('order_id', 'nunique'),
-        )
-        .reset_index()
-    )
-    geo['aov'] = (geo['revenue'] / geo['order_count']).round(2)
-    return geo.sort_values('revenue', ascending=False).reset_index(drop=True)
+    if order_level is None:
+        order_level = build_order_level(sales)
+    if USE_POLARS:
+        return _geographic_metrics_polars(sales, order_level)
+
+    state = _ensure_categorical(sales['customer_state'])
+    revenue, observed = _sum_price_by_category(sales, state)
+
+    # customer_state is constant per order, so counting one row per order
+    # replaces a per-group nunique
+    order_codes = pd.Categorical(order_level['customer_state'], dtype=state.dtype).codes
+    order_count = np.bincount(order_codes[order_codes >= 0], minlength=len(state.cat.categories))
+
+    return _geographic_frame(observed, revenue, order_count[observed.codes])
+
+
+def _geographic_frame(
+    states: pd.Categorical,
+    revenue: np.ndarray,
+    order_count: np.ndarray,
+) -> pd.DataFrame:
+    """Build the calculate_geographic_metrics() frame from per-state totals."""
+    aov = np.round(revenue / order_count, 2)
+
+    order = np.argsort(-revenue, kind='stable')
+    return pd.DataFrame({
+        'customer_state': states[order],
+        'revenue':        revenue[order],
+        'order_count':    order_count[order],
+        'aov':            aov[order],
+    })
 
 
 # ===========================================================================
 # 4. Customer Experience Metrics
 # ===========================================================================
 
-def calculate_delivery_metrics(sales: pd.DataFrame) -> dict:
+def calculate_delivery_metrics(
+    sales: pd.DataFrame,
+    order_level: pd.DataFrame | None = None,
+) -> dict:
     """
     Summarise delivery speed and satisfaction scores.
 
     Parameters
     ----------
     sales : pd.DataFrame
-        Must contain 'delivery_days' and 'review_score' columns.
-        Deduplicate to one row per order before passing in if needed.
+        Must contain 'order_id', 'delivery_days' and 'review_score' columns.
+    order_level : pd.DataFrame or None
+        Output of build_order_level(sales), if already computed.
 
     Returns
     -------
@@ -211,29 +377,21 @@ def calculate_delivery_metrics(sales: pd.DataFrame) -> dict:
         avg_review_score,
         delivery_bucket_summary  (pd.DataFrame: delivery_time, avg_review_score, order_count)
     """
-    order_level = sales[['order_id', 'delivery_days', 'review_score']].drop_duplicates('order_id')
+    if order_level is None:
+        order_level = build_order_level(sales)
 
-    avg_days  = order_level['delivery_days'].mean()
-    avg_score = order_level['review_score'].mean()
+    if USE_POLARS:
+        avg_days  = order_level['delivery_days'].mean()
+        avg_score = order_level['review_score'].mean()
+        bucket_summary = _delivery_buckets_polars(order_level)
+    else:
+        avg_days, avg_score, bucket_summary = _delivery_summary(order_level)
 
-    order_level = order_level.copy()
-    order_level['delivery_time'] = order_level['delivery_days'].apply(_bucket_delivery)
+    return _delivery_dict(avg_days, avg_score, bucket_summary)
 
-    bucket_summary = (
-        order_level.groupby('delivery_time')
-        .agg(
-            avg_review_score=('review_score', 'mean'),
-            order_count=('order_id', 'count'),
-        )
-        .reset_index()
-    )
-    # Ensure logical sort order
-    bucket_order = ['1-3 days', '4-7 days', '8+ days']
-    bucket_summary['delivery_time'] = pd.Categorical(
-        bucket_summary['delivery_time'], categories=bucket_order, ordered=True
-    )
-    bucket_summary = bucket_summary.sort_values('delivery_time').reset_index(drop=True)
 
+def _delivery_dict(avg_days: float, avg_score: float, bucket_summary: pd.DataFrame) -> dict:
+    """Build the calculate_delivery_metrics() dict."""
     return {
         'avg_delivery_days':   round(avg_days, 1),
         'avg_review_score':    round(avg_score, 2),
@@ -241,18 +399,44 @@ def calculate_delivery_metrics(sales: pd.DataFrame) -> dict:
     }
 
 
-def _bucket_delivery(days: float) -> str:
-    """Categorise delivery duration into three speed buckets."""
-    if pd.isna(days):
-        return 'unknown'
-    if days <= 3:
-        return '1-3 days'
-    if days <= 7:
-        return '4-7 days'
-    return '8+ days'
+DELIVERY_BUCKETS = ['1-3 days', '4-7 days', '8+ days']
+_DELIVERY_BUCKET_EDGES = [3, 7]
+_DELIVERY_BUCKET_EDGES_ARR = np.array(_DELIVERY_BUCKET_EDGES, dtype=np.float64)
+
+
+def _delivery_summary(order_level: pd.DataFrame) -> tuple[float, float, pd.DataFrame]:
+    """
+    Average delivery days, average review score and the per-bucket summary.
 
+    All three come from one delivery_stats pass over the order-level arrays;
+    bucket codes index the accumulators, so rows are already in
+    DELIVERY_BUCKETS order.
+    """
+    score_sum, score_n, order_count, days_sum, days_n, total_score, total_n = delivery_stats(
+        order_level['delivery_days'].to_numpy(dtype=np.float64, na_value=np.nan),
+        order_level['review_score'].to_numpy(dtype=np.float64, na_value=np.nan),
+        _DELIVERY_BUCKET_EDGES_ARR,
+    )
 
-def calculate_review_distribution(sales: pd.DataFrame) -> pd.DataFrame:
+    # NaN for empty inputs, as pandas mean would give
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_days  = np.float64(days_sum) / days_n
+        avg_score = np.float64(total_score) / total_n
+        seen = np.flatnonzero(order_count)
+        bucket_score = score_sum[seen] / score_n[seen]
+
+    bucket_summary = pd.DataFrame({
+        'delivery_time':    pd.Categorical.from_codes(seen, categories=DELIVERY_BUCKETS, ordered=True),
+        'avg_review_score': bucket_score,
+        'order_count':      order_count[seen],
+    })
+    return avg_days, avg_score, bucket_summary
+
+
+def calculate_review_distribution(
+    sales: pd.DataFrame,
+    order_level: pd.DataFrame | None = None,
+) -> pd.DataFrame:
     """
     Proportion of orders at each review score (1-5).
 
@@ -260,55 +444,534 @@ def calculate_review_distribution(sales: pd.DataFrame) -> pd.DataFrame:
     ----------
     sales : pd.DataFrame
         Must contain 'order_id' and 'review_score'.
+    order_level : pd.DataFrame or None
+        Output of build_order_level(sales), if already computed.
 
     Returns
     -------
     pd.DataFrame with columns: review_score, proportion (0-1), pct
+        one row per score 1-5, in score order.
+    """
+    if order_level is None:
+        order_level = build_order_level(sales)
+
+    # Scores are small integers, so a bincount replaces the hash-based value_counts
+    scores = order_level['review_score'].dropna().to_numpy(dtype=np.int64)
+    return _review_distribution_frame(np.bincount(scores, minlength=6)[1:6])
+
+
+def _review_distribution_frame(counts: np.ndarray) -> pd.DataFrame:
+    """Build the calculate_review_distribution() frame from order counts for scores 1-5."""
+    total = counts.sum()
+    proportion = counts / total if total else np.zeros(len(counts))
+
+    return pd.DataFrame({
+        'review_score': np.arange(1, 6),
+        'proportion':   proportion,
+        'pct':          (proportion * 100).round(1),
+    })
+
+
+# ===========================================================================
+# 5. Daily totals
+# ===========================================================================
+
+DAILY_TOTAL_COLUMNS = [
+    'revenue', 'orders',
+    'delivery_days_sum', 'delivery_days_count',
+    'review_score_sum', 'review_score_count',
+]
+
+
+def calculate_daily_totals(sales: pd.DataFrame) -> pd.DataFrame:
     """
-    order_level = sales[['order_id', 'review_score']].drop_duplicates('order_id')
-    dist = (
-        order_level['review_score']
-        .value_counts(normalize=True)
-        .reset_index()
-        .rename(columns={'proportion': 'proportion'})
-        .sort_values('review_score')
+    Additive totals per purchase day.
+
+    Every column is a sum or a count, so the totals for any run of whole days
+    are the column sums over those days. Build this once for a dataset and
+    get period metrics from calculate_period_totals, which works on a few
+    hundred daily rows instead of every line item.
+
+    Parameters
+    ----------
+    sales : pd.DataFrame
+        Must contain 'order_purchase_timestamp', 'order_id', 'price',
+        'delivery_days' and 'review_score'.
+
+    Returns
+    -------
+    pd.DataFrame indexed by purchase date (midnight timestamps, ascending) with
+    columns DAILY_TOTAL_COLUMNS. Order-level sums count each order once.
+    """
+    day = sales['order_purchase_timestamp'].dt.normalize()
+    revenue = sales['price'].astype(np.float64).groupby(day).sum().round(2)
+
+    # Each order has a single purchase timestamp, so per-day order counts add up
+    first = ~sales['order_id'].duplicated()
+    orders = sales.loc[first, ['delivery_days', 'review_score']].groupby(day[first])
+    per_order = orders.agg(['sum', 'count'])
+    per_order.columns = [f'{col}_{stat}' for col, stat in per_order.columns]
+    per_order['orders'] = orders.size()
+
+    daily = per_order.join(revenue.rename('revenue'), how='outer').fillna(0)
+    daily.index.name = 'purchase_date'
+    return daily[DAILY_TOTAL_COLUMNS].sort_index()
+
+
+def calculate_period_totals(
+    daily: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> dict:
+    """
+    Revenue, order and customer-experience totals for the whole days start..end.
+
+    Parameters
+    ----------
+    daily : pd.DataFrame
+        Output of calculate_daily_totals().
+    start, end : pd.Timestamp
+        First and last day of the period (both inclusive; times are ignored).
+
+    Returns
+    -------
+    dict with keys:
+        revenue, orders, avg_delivery_days, avg_review_score,
+        monthly  (pd.DataFrame: purchase_month, revenue, mom_growth_pct)
+    """
+    window = daily.loc[start.normalize():end.normalize()]
+    totals = window.sum()
+
+    # Months are 1-12, so they index a 13-slot accumulator directly
+    revenue, counts = agg_by_code(
+        window.index.month.to_numpy(dtype=np.intp), window['revenue'].to_numpy(dtype=np.float64), 13
     )
-    dist['pct'] = (dist['proportion'] * 100).round(1)
-    return dist
+    seen = np.flatnonzero(counts)
+    monthly = pd.DataFrame({'purchase_month': seen, 'revenue': revenue[seen].round(2)})
+    monthly['mom_growth_pct'] = monthly['revenue'].pct_change() * 100
+
+    def ratio(num, den):
+        return totals[num] / totals[den] if totals[den] else np.nan
+
+    return {
+        'revenue':           round(float(totals['revenue']), 2),
+        'orders':            int(totals['orders']),
+        'avg_delivery_days': round(ratio('delivery_days_sum', 'delivery_days_count'), 1),
+        'avg_review_score':  round(ratio('review_score_sum', 'review_score_count'), 2),
+        'monthly':           monthly,
+    }
+
+
+def calculate_revenue_metrics_from_totals(
+    current_totals: dict,
+    comparison_totals: dict,
+    current_year: int,
+    comparison_year: int,
+) -> dict:
+    """
+    calculate_revenue_metrics() for two periods given as calculate_period_totals() dicts.
+
+    Returns
+    -------
+    dict with the same keys as calculate_revenue_metrics().
+    """
+    return _revenue_kpis(
+        current_year, comparison_year,
+        current_totals['revenue'], comparison_totals['revenue'],
+        current_totals['orders'], comparison_totals['orders'],
+    )
+
+
+def calculate_daily_state_totals(sales: pd.DataFrame) -> pd.DataFrame:
+    """
+    Revenue and order count per purchase day and customer state.
+
+    The state-level counterpart of calculate_daily_totals: both columns are
+    additive, so calculate_period_geographic_metrics gets the geographic
+    metrics for any run of whole days from these rows alone.
+
+    Parameters
+    ----------
+    sales : pd.DataFrame
+        Must contain 'order_purchase_timestamp', 'order_id', 'customer_state'
+        and 'price'.
+
+    Returns
+    -------
+    pd.DataFrame indexed by purchase date (midnight timestamps, ascending) with
+    columns: customer_state (categorical), revenue, order_count.
+    One row per day and state with sales.
+    """
+    day = sales['order_purchase_timestamp'].dt.normalize().rename('purchase_date')
+    state = _ensure_categorical(sales['customer_state'])
+    revenue = sales['price'].astype(np.float64).groupby([day, state], observed=True).sum().round(2)
+
+    # An order has one purchase day and one state, so counting its first row suffices
+    first = ~sales['order_id'].duplicated()
+    orders = state[first].groupby([day[first], state[first]], observed=True).size()
+
+    daily_state = (
+        pd.DataFrame({'revenue': revenue, 'order_count': orders})
+        .fillna(0)
+        .astype({'order_count': np.int64})
+        .reset_index('customer_state')
+    )
+    return daily_state.sort_index(kind='stable')
+
+
+def calculate_period_geographic_metrics(
+    daily_state: pd.DataFrame,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> pd.DataFrame:
+    """
+    calculate_geographic_metrics() for the whole days start..end.
+
+    Parameters
+    ----------
+    daily_state : pd.DataFrame
+        Output of calculate_daily_state_totals().
+    start, end : pd.Timestamp
+        First and last day of the period (both inclusive; times are ignored).
+
+    Returns
+    -------
+    pd.DataFrame with the same columns and order as calculate_geographic_metrics().
+    """
+    window = daily_state.loc[start.normalize():end.normalize()]
+    state = window['customer_state']
+    codes = state.cat.codes.to_numpy()
+    ngroups = len(state.cat.categories)
+
+    revenue, rows = agg_by_code(codes, window['revenue'].to_numpy(dtype=np.float64), ngroups)
+    order_count = np.bincount(codes, weights=window['order_count'].to_numpy(), minlength=ngroups)
+    seen = np.flatnonzero(rows)
+    return _geographic_frame(
+        pd.Categorical.from_codes(seen, dtype=state.dtype),
+        np.round(revenue[seen], 2),
+        order_count[seen].astype(np.int64),
+    )
+
+
+# ===========================================================================
+# 6. All metrics at once
+# ===========================================================================
+
+def compute_all_metrics(
+    current_sales: pd.DataFrame,
+    comparison_sales: pd.DataFrame | None,
+    current_year: int,
+    comparison_year: int,
+    exclude: tuple[str, ...] = (),
+) -> dict:
+    """
+    Run the independent calculate_* functions for one analysis period.
+
+    With USE_POLARS set this delegates to compute_all_metrics_lazy. Otherwise,
+    with dask installed, the calculations run concurrently on the threaded
+    scheduler, or one after another without it. The metric functions only
+    read their input frames, so sharing current_sales across threads is safe.
+
+    Parameters
+    ----------
+    current_sales : pd.DataFrame
+        Filtered sales dataset for the year being analysed.
+    comparison_sales : pd.DataFrame or None
+        Filtered sales dataset for the comparison year. Pass None to skip the
+        revenue comparison (e.g. when it comes from calculate_period_totals).
+    current_year : int
+    comparison_year : int
+    exclude : tuple of str
+        Result keys to skip because the caller already has them (e.g.
+        ('monthly',) when it comes from calculate_period_totals).
+
+    Returns
+    -------
+    dict with keys (minus any in exclude):
+        revenue              (calculate_revenue_metrics; omitted when comparison_sales is None)
+        monthly              (calculate_monthly_revenue)
+        products             (calculate_product_metrics)
+        geographic           (calculate_geographic_metrics)
+        delivery             (calculate_delivery_metrics)
+        review_distribution  (calculate_review_distribution)
+    """
+    if USE_POLARS:
+        return compute_all_metrics_lazy(
+            current_sales, comparison_sales, current_year, comparison_year, exclude
+        )
+
+    order_level = build_order_level(current_sales)
+    calls = {
+        'revenue':    (calculate_revenue_metrics,
+                       (current_sales, comparison_sales, current_year, comparison_year)),
+        'monthly':    (calculate_monthly_revenue, (current_sales,)),
+        'products':   (calculate_product_metrics, (current_sales,)),
+        'geographic': (calculate_geographic_metrics, (current_sales, order_level)),
+        'delivery':   (calculate_delivery_metrics, (current_sales, order_level)),
+        'review_distribution': (calculate_review_distribution, (current_sales, order_level)),
+    }
+    if comparison_sales is None:
+        del calls['revenue']
+    for key in exclude:
+        calls.pop(key, None)
+
+    try:
+        import dask  # imported here so loading this module does not pay for it
+    except ImportError:  # optional: run the calculations sequentially
+        return {key: func(*args) for key, (func, args) in calls.items()}
+
+    tasks = [dask.delayed(func)(*args) for func, args in calls.values()]
+    results = dask.compute(*tasks, scheduler='threads')
+    return dict(zip(calls, results))
+
+
+# ===========================================================================
+# 7. Polars backend (used when USE_POLARS is set)
+# ===========================================================================
+
+def _to_polars(df: pd.DataFrame, cols: list[str]) -> 'pl.LazyFrame':
+    """Convert the needed columns of a pandas frame to a Polars LazyFrame."""
+    return pl.from_pandas(df[cols]).lazy()
+
+
+def _revenue_sum() -> 'pl.Expr':
+    """Revenue as a float64 sum of price, rounded to cents."""
+    return pl.col('price').cast(pl.Float64).sum().round(2).alias('revenue')
+
+
+def _order_level_lazy(lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+    """Polars version of build_order_level: first row per order_id."""
+    return lf.unique(subset='order_id', keep='first', maintain_order=True)
+
+
+def _monthly_revenue_lazy(lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+    """Lazy plan for calculate_monthly_revenue (null keys are dropped, as pandas does)."""
+    return (
+        lf.drop_nulls('purchase_month')
+        .group_by('purchase_month')
+        .agg(_revenue_sum())
+        .sort('purchase_month')
+        .with_columns((pl.col('revenue').pct_change() * 100).alias('mom_growth_pct'))
+    )
+
+
+def _product_metrics_lazy(lf: 'pl.LazyFrame') -> 'pl.LazyFrame':
+    """Lazy plan for calculate_product_metrics (null keys are dropped, as pandas does)."""
+    return (
+        lf.drop_nulls('product_category_name')
+        .group_by('product_category_name')
+        .agg(_revenue_sum())
+        .with_columns(
+            (pl.col('revenue') / pl.col('revenue').sum() * 100).round(2).alias('market_share_pct')
+        )
+        .sort('revenue', descending=True)
+    )
+
+
+def _geographic_metrics_lazy(lf: 'pl.LazyFrame', orders: 'pl.LazyFrame') -> 'pl.LazyFrame':
+    """Lazy plan for calculate_geographic_metrics (null keys are dropped, as pandas does)."""
+    order_count = (
+        orders.drop_nulls('customer_state')
+        .group_by('customer_state')
+        .agg(pl.len().cast(pl.Int64).alias('order_count'))
+    )
+    return (
+        lf.drop_nulls('customer_state')
+        .group_by('customer_state')
+        .agg(_revenue_sum())
+        .join(order_count, on='customer_state', how='left')
+        .with_columns((pl.col('revenue') / pl.col('order_count')).round(2).alias('aov'))
+        .sort('revenue', descending=True)
+    )
+
+
+def _delivery_buckets_lazy(orders: 'pl.LazyFrame') -> 'pl.LazyFrame':
+    """Lazy plan for the delivery bucket summary, keyed by bucket code."""
+    # Number of edges below the duration = DELIVERY_BUCKETS index; null days stay null
+    code = sum((pl.col('delivery_days') > edge).cast(pl.Int8) for edge in _DELIVERY_BUCKET_EDGES)
+    return (
+        orders.select(code.alias('_code'), 'order_id', 'review_score')
+        .drop_nulls('_code')
+        .group_by('_code')
+        .agg(
+            pl.col('review_score').mean().alias('avg_review_score'),
+            pl.col('order_id').count().cast(pl.Int64).alias('order_count'),
+        )
+        .sort('_code')
+    )
+
+
+def _delivery_buckets_frame(summary: pd.DataFrame) -> pd.DataFrame:
+    """Turn a collected _delivery_buckets_lazy result into the bucket summary frame."""
+    return pd.DataFrame({
+        'delivery_time': pd.Categorical.from_codes(
+            summary['_code'], categories=DELIVERY_BUCKETS, ordered=True
+        ),
+        'avg_review_score': summary['avg_review_score'],
+        'order_count': summary['order_count'],
+    })
+
+
+def _monthly_revenue_polars(sales: pd.DataFrame) -> pd.DataFrame:
+    """Polars version of calculate_monthly_revenue."""
+    lf = _to_polars(sales, ['purchase_month', 'price'])
+    return _monthly_revenue_lazy(lf).collect().to_pandas()
+
+
+def _product_metrics_polars(sales: pd.DataFrame) -> pd.DataFrame:
+    """Polars version of calculate_product_metrics."""
+    lf = _to_polars(sales, ['product_category_name', 'price'])
+    return _product_metrics_lazy(lf).collect().to_pandas()
+
+
+def _geographic_metrics_polars(sales: pd.DataFrame, order_level: pd.DataFrame) -> pd.DataFrame:
+    """Polars version of calculate_geographic_metrics."""
+    lf = _to_polars(sales, ['customer_state', 'price'])
+    orders = _to_polars(order_level, ['customer_state'])
+    return _geographic_metrics_lazy(lf, orders).collect().to_pandas()
+
+
+def _delivery_buckets_polars(order_level: pd.DataFrame) -> pd.DataFrame:
+    """Polars version of the delivery bucket summary in calculate_delivery_metrics."""
+    orders = _to_polars(order_level, ['order_id', 'delivery_days', 'review_score'])
+    return _delivery_buckets_frame(_delivery_buckets_lazy(orders).collect().to_pandas())
+
+
+def compute_all_metrics_lazy(
+    current_sales: pd.DataFrame,
+    comparison_sales: pd.DataFrame | None,
+    current_year: int,
+    comparison_year: int,
+    exclude: tuple[str, ...] = (),
+) -> dict:
+    """
+    Polars version of compute_all_metrics, planned as one fused query.
+
+    Every aggregation is expressed on a single LazyFrame over current_sales
+    and collected together with pl.collect_all, so Polars scans the data once
+    and shares the order-level deduplication between the metrics that need
+    it. Requires polars; compute_all_metrics uses it automatically when
+    USE_POLARS is set.
+
+    Returns
+    -------
+    dict with the same keys and value types as compute_all_metrics()
+    (no 'revenue' entry when comparison_sales is None, no entries for the
+    keys in exclude; those are still part of the fused plan).
+    """
+    global pl
+    if pl is None:
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError('compute_all_metrics_lazy requires polars') from None
+
+    lf = _to_polars(current_sales, [
+        'order_id', 'price', 'purchase_month', 'product_category_name',
+        'customer_state', 'delivery_days', 'review_score',
+    ])
+    orders = _order_level_lazy(lf)
+    totals = [pl.col('price').cast(pl.Float64).sum().alias('revenue'),
+              pl.col('order_id').n_unique().alias('orders')]
+
+    (monthly, products, geographic, buckets, averages, scores, *year_totals) = pl.collect_all([
+        _monthly_revenue_lazy(lf),
+        _product_metrics_lazy(lf),
+        _geographic_metrics_lazy(lf, orders),
+        _delivery_buckets_lazy(orders),
+        orders.select(pl.col('delivery_days').mean(), pl.col('review_score').mean()),
+        orders.drop_nulls('review_score')
+              .group_by(pl.col('review_score').cast(pl.Int64))
+              .agg(pl.len().alias('n')),
+        *([] if comparison_sales is None else [
+            lf.select(totals),
+            _to_polars(comparison_sales, ['order_id', 'price']).select(totals),
+        ]),
+    ])
+
+    score_counts = np.zeros(6, dtype=np.int64)
+    score_counts[scores['review_score'].to_numpy()] = scores['n'].to_numpy()
+
+    results = {
+        'monthly':    monthly.to_pandas(),
+        'products':   products.to_pandas(),
+        'geographic': geographic.to_pandas(),
+        'delivery':   _delivery_dict(
+            averages['delivery_days'].item(),
+            averages['review_score'].item(),
+            _delivery_buckets_frame(buckets.to_pandas()),
+        ),
+        'review_distribution': _review_distribution_frame(score_counts[1:6]),
+    }
+    if year_totals:
+        cur_totals, comp_totals = year_totals
+        results['revenue'] = _revenue_kpis(
+            current_year, comparison_year,
+            cur_totals['revenue'].fill_null(0.0).item(), comp_totals['revenue'].fill_null(0.0).item(),
+            cur_totals['orders'].item(), comp_totals['orders'].item(),
+        )
+    for key in exclude:
+        results.pop(key, None)
+    return results
 
 
 # ===========================================================================
 # Visualisations
 # ===========================================================================
 
+def _revenue_by_month(sales: pd.DataFrame, monthly: pd.DataFrame | None) -> np.ndarray:
+    """
+    Revenue for months 1-12 as a length-12 array, NaN for months without sales.
+
+    Uses the precomputed calculate_monthly_revenue() table when given,
+    otherwise sums price by month directly from the sales frame.
+    """
+    if monthly is not None:
+        return (
+            monthly.set_index('purchase_month')['revenue']
+            .reindex(range(1, 13))
+            .to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+    revenue, counts = _price_totals(_month_codes(sales), sales, 13)
+    return np.where(counts[1:] > 0, revenue[1:], np.nan)
+
+
 def plot_revenue_trend(
     current_sales: pd.DataFrame,
     comparison_sales: pd.DataFrame,
     current_year: int,
     comparison_year: int,
+    monthly_cur: pd.DataFrame | None = None,
+    monthly_comp: pd.DataFrame | None = None,
 ) -> plt.Figure:
     """
     Line chart of monthly revenue for the current year vs the comparison year.
 
+    Parameters
+    ----------
+    monthly_cur, monthly_comp : pd.DataFrame or None
+        Output of calculate_monthly_revenue() for each year, if already
+        computed. Computed from the sales frames when None.
+
     Returns
     -------
     matplotlib.figure.Figure
     """
-    cur  = calculate_monthly_revenue(current_sales)
-    comp = calculate_monthly_revenue(comparison_sales)
+    months = np.arange(1, 13)
+    cur  = _revenue_by_month(current_sales, monthly_cur)
+    comp = _revenue_by_month(comparison_sales, monthly_comp)
 
-    months = range(1, 13)
     month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
 
     fig, ax = plt.subplots(figsize=FIGURE_SIZE_WIDE)
 
-    ax.plot(cur['purchase_month'],  cur['revenue'],  marker='o', color=PRIMARY_COLOR,
+    ax.plot(months, cur,  marker='o', color=PRIMARY_COLOR,
             linewidth=2, markersize=5, label=str(current_year))
-    ax.plot(comp['purchase_month'], comp['revenue'], marker='s', color=SECONDARY_COLOR,
+    ax.plot(months, comp, marker='s', color=SECONDARY_COLOR,
             linewidth=2, markersize=5, linestyle='--', label=str(comparison_year))
 
-    ax.set_xticks(list(months))
+    ax.set_xticks(months)
     ax.set_xticklabels(month_labels)
     ax.yaxis.set_major_formatter(mticker.FuncFormatter(lambda v, _: f'${v/1e3:.0f}K'))
     ax.legend(title='Year', frameon=False)
@@ -323,17 +986,31 @@ def plot_revenue_trend(
     return fig
 
 
-def plot_mom_growth(current_sales: pd.DataFrame, current_year: int) -> plt.Figure:
+def plot_mom_growth(
+    monthly_or_sales: pd.DataFrame,
+    current_year: int,
+) -> plt.Figure:
     """
     Bar chart of month-over-month revenue growth rate (%) for the current year.
 
+    Parameters
+    ----------
+    monthly_or_sales : pd.DataFrame
+        Preferably the output of calculate_monthly_revenue() for the current
+        year; a current-year sales dataset is also accepted and aggregated here.
+    current_year : int
+
     Returns
     -------
     matplotlib.figure.Figure
     """
-    monthly = calculate_monthly_revenue(current_sales).dropna(subset=['mom_growth_pct'])
+    if 'mom_growth_pct' in monthly_or_sales.columns:
+        monthly = monthly_or_sales
+    else:
+        monthly = calculate_monthly_revenue(monthly_or_sales)
+    monthly = monthly.dropna(subset=['mom_growth_pct'])
 
-    colors = [POS_COLOR if v >= 0 else NEG_COLOR for v in monthly['mom_growth_pct']]
+    colors = np.where(monthly['mom_growth_pct'].to_numpy() >= 0, POS_COLOR, NEG_COLOR)
     month_labels = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     labels = [month_labels[int(m) - 1] for m in monthly['purchase_month']]
@@ -440,9 +1117,7 @@ def plot_review_distribution(review_dist: pd.DataFrame, current_year: int) -> pl
     matplotlib.figure.Figure
     """
     fig, ax = plt.subplots(figsize=(8, 4))
-    colors = [PRIMARY_COLOR if s == 5 else SECONDARY_COLOR if s == 4
-              else ACCENT_COLOR if s == 3 else NEG_COLOR
-              for s in review_dist['review_score']]
+    colors = review_dist['review_score'].map(_REVIEW_COLORS).to_numpy()
 
     ax.barh(
         review_dist['review_score'].astype(str),
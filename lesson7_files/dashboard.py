@@ -16,11 +16,12 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from data_loader import load_and_process_data
 from business_metrics import (
-    calculate_revenue_metrics,
-    calculate_monthly_revenue,
-    calculate_product_metrics,
-    calculate_geographic_metrics,
-    calculate_delivery_metrics,
+    calculate_daily_state_totals,
+    calculate_daily_totals,
+    calculate_period_geographic_metrics,
+    calculate_period_totals,
+    calculate_revenue_metrics_from_totals,
+    compute_all_metrics,
 )
 
 # ── Page config ───────────────────────────────────────────────────────────────
@@ -88,15 +89,47 @@ st.markdown(
 
 
 # ── Data loading (cached) ─────────────────────────────────────────────────────
+@st.cache_resource
+def get_loader(path: str = "ecommerce_data/"):
+    """Shared loader holding the raw tables; cached as a resource, never hashed or copied."""
+    loader, _ = load_and_process_data(path)
+    return loader
+
+
+@st.cache_data
+def get_date_bounds(path: str = "ecommerce_data/") -> dict:
+    """First and last purchase date, for the date picker limits."""
+    ts = get_loader(path).processed["order_purchase_timestamp"]
+    return {"min_date": ts.min().date(), "max_date": ts.max().date()}
+
+
+@st.cache_data
+def get_delivered(path: str = "ecommerce_data/") -> tuple[pd.DataFrame, np.ndarray]:
+    """Delivered orders sorted by purchase time, plus those times as int64 nanoseconds."""
+    # Sorted so date windows are two binary searches instead of a mask
+    delivered = (
+        get_loader(path).delivered.dropna(subset=["order_purchase_timestamp"])
+        .sort_values("order_purchase_timestamp", kind="stable", ignore_index=True)
+    )
+    ts_ns = delivered["order_purchase_timestamp"].to_numpy("datetime64[ns]").view(np.int64)
+    return delivered, ts_ns
+
+
+@st.cache_data
+def get_daily_totals(path: str = "ecommerce_data/") -> pd.DataFrame:
+    """Per-day totals of the delivered orders; period KPIs are sums over these rows."""
+    return calculate_daily_totals(get_loader(path).delivered)
+
+
 @st.cache_data
-def load_data(path: str = "ecommerce_data/"):
-    loader, processed = load_and_process_data(path)
-    return loader, processed
+def get_daily_state_totals(path: str = "ecommerce_data/") -> pd.DataFrame:
+    """Per-day, per-state revenue and order counts of the delivered orders."""
+    return calculate_daily_state_totals(get_loader(path).delivered)
 
 
-loader, processed = load_data()
-_min_date = processed["order_purchase_timestamp"].min().date()
-_max_date = processed["order_purchase_timestamp"].max().date()
+_bounds = get_date_bounds()
+_min_date = _bounds["min_date"]
+_max_date = _bounds["max_date"]
 
 
 # ── Header ────────────────────────────────────────────────────────────────────
@@ -138,40 +171,66 @@ comp_year = cur_year - 1
 
 
 # ── Filter helpers ────────────────────────────────────────────────────────────
-def _filter(df: pd.DataFrame, s: pd.Timestamp, e: pd.Timestamp) -> pd.DataFrame:
-    mask = (
-        (df["order_purchase_timestamp"] >= s)
-        & (df["order_purchase_timestamp"] <= e)
-        & (df["order_status"] == "delivered")
+def _filter(df: pd.DataFrame, ts_ns: np.ndarray, s: pd.Timestamp, e: pd.Timestamp) -> pd.DataFrame:
+    # Whole days s..e, matching the day granularity of the daily totals. ts_ns
+    # holds df's sorted purchase times, so the bounds are two binary searches
+    # and the result is a positional slice.
+    lo = np.searchsorted(ts_ns, s.normalize().value, side="left")
+    hi = np.searchsorted(ts_ns, (e.normalize() + pd.Timedelta(days=1)).value, side="left")
+    return df.iloc[lo:hi]
+
+
+# ── Compute metrics (cached per date range) ───────────────────────────────────
+@st.cache_data(show_spinner=False)
+def get_period_metrics(
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    comp_start: pd.Timestamp,
+    comp_end: pd.Timestamp,
+    path: str = "ecommerce_data/",
+) -> dict | None:
+    """
+    Every metric on the page for one date range, or None if it has no delivered orders.
+
+    Keyed on the dates alone — the frames come from the cached loaders above —
+    so revisiting a range is a cache lookup rather than a recomputation.
+    """
+    delivered, ts_ns = get_delivered(path)
+    sales_cur = _filter(delivered, ts_ns, start, end)
+    if sales_cur.empty:
+        return None
+
+    # Period totals are sums over the cached daily table, so the comparison period
+    # never touches row-level data
+    daily = get_daily_totals(path)
+    cur_tot  = calculate_period_totals(daily, start, end)
+    comp_tot = calculate_period_totals(daily, comp_start, comp_end)
+    rev_m    = calculate_revenue_metrics_from_totals(cur_tot, comp_tot, end.year, end.year - 1)
+
+    geographic = calculate_period_geographic_metrics(get_daily_state_totals(path), start, end)
+
+    # Monthly revenue is already part of cur_tot, the map comes from the state
+    # totals above and the page shows no review distribution
+    metrics = compute_all_metrics(
+        sales_cur, None, end.year, end.year - 1,
+        exclude=("monthly", "geographic", "review_distribution"),
     )
-    return df[mask].reset_index(drop=True)
+    return {"cur_tot": cur_tot, "comp_tot": comp_tot, "rev_m": rev_m, "geographic": geographic, **metrics}
 
 
-sales_cur  = _filter(processed, start_dt, end_dt)
-sales_comp = _filter(processed, comp_start, comp_end)
+period = get_period_metrics(start_dt, end_dt, comp_start, comp_end)
 
-if sales_cur.empty:
+if period is None:
     st.warning("No delivered orders found for the selected date range. Please adjust the filter.")
     st.stop()
 
-# Keep an empty-but-schema-correct DataFrame if no comparison data exists
-if sales_comp.empty:
-    sales_comp = pd.DataFrame(columns=sales_cur.columns)
-
-
-# ── Compute metrics ───────────────────────────────────────────────────────────
-rev_m    = calculate_revenue_metrics(sales_cur, sales_comp, cur_year, comp_year)
-monthly  = calculate_monthly_revenue(sales_cur)
-prod_m   = calculate_product_metrics(sales_cur)
-geo_m    = calculate_geographic_metrics(sales_cur)
-del_m    = calculate_delivery_metrics(sales_cur)
-
-del_m_comp: dict | None = None
-if not sales_comp.empty:
-    try:
-        del_m_comp = calculate_delivery_metrics(sales_comp)
-    except Exception:
-        pass
+cur_tot  = period["cur_tot"]
+comp_tot = period["comp_tot"]
+rev_m    = period["rev_m"]
+monthly  = cur_tot["monthly"]
+prod_m   = period["products"]
+geo_m    = period["geographic"]
+del_m    = period["delivery"]
 
 
 # ── Format helpers ────────────────────────────────────────────────────────────
@@ -193,6 +252,17 @@ def fmt_axis(v: float) -> str:
     return f"${v:.0f}"
 
 
+def fmt_axis_vec(values) -> list[str]:
+    """fmt_axis for a whole tick set, with one unit picked from its largest value."""
+    scaled = np.asarray(values, dtype=np.float64)
+    top = np.abs(scaled).max(initial=0.0)
+    if top >= 1_000_000:
+        return [f"${v:.1f}M" for v in scaled / 1_000_000]
+    if top >= 1_000:
+        return [f"${v:.0f}K" for v in scaled / 1_000]
+    return [f"${v:.0f}" for v in scaled]
+
+
 def trend_html(pct, inverted: bool = False) -> str:
     """
     Return an HTML trend badge.
@@ -272,11 +342,10 @@ PRIMARY    = "#1e4976"        # deeper blue for better contrast
 SECONDARY  = "#4e8fc4"
 FONT_COLOR = "#111827"        # near-black for all chart text
 AXIS_COLOR = "#374151"        # dark gray for axis labels / ticks
-MTHS       = {
-    1: "Jan", 2: "Feb", 3: "Mar", 4: "Apr",
-    5: "May", 6: "Jun", 7: "Jul", 8: "Aug",
-    9: "Sep", 10: "Oct", 11: "Nov", 12: "Dec",
-}
+MTHS       = np.array([                  # indexed by month number - 1
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+])
 
 # Shared layout defaults applied to every figure (no margin — set per chart)
 _BASE = dict(
@@ -307,27 +376,23 @@ gc1, gc2 = st.columns(2)
 
 # Chart 1: Revenue trend (solid = current, dashed = comparison)
 with gc1:
-    cur_m  = calculate_monthly_revenue(sales_cur)
-    comp_m = (
-        calculate_monthly_revenue(sales_comp)
-        if not sales_comp.empty
-        else pd.DataFrame(columns=["purchase_month", "revenue"])
-    )
-    cur_m["label"]  = cur_m["purchase_month"].map(MTHS)
+    cur_m  = monthly
+    comp_m = comp_tot["monthly"]
+    cur_m["label"]  = MTHS[cur_m["purchase_month"].to_numpy() - 1]
     if not comp_m.empty:
-        comp_m["label"] = comp_m["purchase_month"].map(MTHS)
+        comp_m["label"] = MTHS[comp_m["purchase_month"].to_numpy() - 1]
+    # Calendar order even when the comparison period has months the current one lacks
+    month_axis = MTHS[np.union1d(cur_m["purchase_month"], comp_m["purchase_month"]) - 1]
 
-    all_revs = list(cur_m["revenue"]) + (
-        list(comp_m["revenue"]) if not comp_m.empty else []
-    )
+    all_revs = np.concatenate([cur_m["revenue"].to_numpy(), comp_m["revenue"].to_numpy()])
     # Zoom y-axis to show trend variation (don't start at 0)
-    y_min_data = min(all_revs) if all_revs else 0
-    y_max_data = max(all_revs) if all_revs else 1
+    y_min_data = all_revs.min() if all_revs.size else 0
+    y_max_data = all_revs.max() if all_revs.size else 1
     y_pad      = (y_max_data - y_min_data) * 0.15
     y_lo       = max(0, y_min_data - y_pad)
     y_hi       = y_max_data + y_pad
     y_ticks    = np.linspace(y_lo, y_hi, 6)
-    y_labels   = [fmt_axis(v) for v in y_ticks]
+    y_labels   = fmt_axis_vec(y_ticks)
 
     f1 = go.Figure()
     f1.add_trace(
@@ -355,7 +420,10 @@ with gc1:
         **_BASE,
         margin=_MARGIN,
         title=_title(f"Monthly Revenue: {cur_year} vs {comp_year}"),
-        xaxis=_xaxis(showgrid=True, gridcolor=GRID_C, gridwidth=1),
+        xaxis=_xaxis(
+            showgrid=True, gridcolor=GRID_C, gridwidth=1,
+            categoryorder="array", categoryarray=month_axis,
+        ),
         yaxis=_yaxis(
             showgrid=True,
             gridcolor=GRID_C,
@@ -384,7 +452,7 @@ with gc2:
     ]
     max_cat  = top10["revenue"].max()
     x_ticks  = np.linspace(0, max_cat * 1.20, 6)
-    x_labels = [fmt_axis(v) for v in x_ticks]
+    x_labels = fmt_axis_vec(x_ticks)
 
     f2 = go.Figure(
         go.Bar(
@@ -503,8 +571,8 @@ bc1, bc2 = st.columns(2)
 
 with bc1:
     avg_days = del_m["avg_delivery_days"]
-    if del_m_comp is not None:
-        comp_days = del_m_comp["avg_delivery_days"]
+    if comp_tot["orders"]:
+        comp_days = comp_tot["avg_delivery_days"]
         days_pct  = (
             (avg_days - comp_days) / comp_days * 100 if comp_days else None
         )
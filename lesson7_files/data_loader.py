@@ -14,9 +14,20 @@ Usage
     sales = loader.create_sales_dataset(year_filter=2023, status_filter='delivered')
 """
 
+import glob
+import hashlib
 import os
+import tempfile
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # optional: falls back to pandas.read_csv
+    pa = None
+
 
 class EcommerceDataLoader:
     """
@@ -51,10 +62,19 @@ class EcommerceDataLoader:
         'order_items': ['shipping_limit_date'],
     }
 
+    # Parquet copies of the CSVs (written on first load when pyarrow is available)
+    PARQUET_CACHE_DIR = '.parquet_cache'
+    # Stored with each raw Parquet copy; bump it when the Arrow read options change
+    RAW_CACHE_FORMAT = 2
+
+    # Low-cardinality string columns stored as categoricals in the processed frame
+    CATEGORY_COLS = ['order_status', 'product_category_name', 'customer_state']
+
     def __init__(self, data_path: str):
         self.data_path = data_path
         self.raw: dict[str, pd.DataFrame] = {}
         self.processed: pd.DataFrame | None = None
+        self.delivered: pd.DataFrame | None = None
 
     # ------------------------------------------------------------------
     # Loading
@@ -70,13 +90,84 @@ class EcommerceDataLoader:
         """
         for key, filename in self.FILES.items():
             filepath = os.path.join(self.data_path, filename)
-            df = pd.read_csv(filepath)
-            for col in self.DATETIME_COLS.get(key, []):
-                if col in df.columns:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
-            self.raw[key] = df
+            if pa is None:
+                self.raw[key] = self._read_csv_pandas(key, filepath)
+            else:
+                self.raw[key] = self._read_csv_arrow(key, filepath)
         return self.raw
 
+    def _read_csv_pandas(self, key: str, filepath: str) -> pd.DataFrame:
+        """Read one CSV with pandas, coercing unparseable timestamps to NaT."""
+        df = pd.read_csv(filepath)
+        for col in self.DATETIME_COLS.get(key, []):
+            if col in df.columns:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+        return df
+
+    def _read_csv_arrow(self, key: str, filepath: str) -> pd.DataFrame:
+        """
+        Read one CSV with pyarrow, via a Parquet copy when one is up to date.
+
+        Timestamp columns are parsed natively by the multi-threaded Arrow
+        reader. The parsed table is written to PARQUET_CACHE_DIR so later loads
+        skip CSV parsing. The copy records the CSV's size and modification time
+        in its metadata (with RAW_CACHE_FORMAT) and is reused only while they
+        still match, so a CSV replaced by an older-dated copy is re-parsed too.
+        Empty fields are read as missing values, as the pandas reader does.
+        """
+        cache_dir = os.path.join(self.data_path, self.PARQUET_CACHE_DIR)
+        name = os.path.splitext(os.path.basename(filepath))[0]
+        cache_path = os.path.join(cache_dir, f'{name}.parquet')
+        stat = os.stat(filepath)
+        source = f'{self.RAW_CACHE_FORMAT}:{stat.st_size}:{stat.st_mtime_ns}'.encode()
+        if os.path.exists(cache_path):
+            try:
+                metadata = pq.read_schema(cache_path).metadata or {}
+                if metadata.get(b'source_csv') == source:
+                    return pq.read_table(cache_path).to_pandas()
+            except (OSError, pa.ArrowInvalid):
+                pass  # truncated or corrupt copy; re-parse the CSV and rewrite it
+
+        convert = pacsv.ConvertOptions(
+            column_types={col: pa.timestamp('ns') for col in self.DATETIME_COLS.get(key, [])},
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True,
+        )
+        try:
+            table = pacsv.read_csv(filepath, convert_options=convert)
+        except pa.ArrowInvalid:
+            # Malformed timestamps: use pandas, which coerces them to NaT
+            return self._read_csv_pandas(key, filepath)
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            metadata = {**(table.schema.metadata or {}), b'source_csv': source}
+            table = table.replace_schema_metadata(metadata)
+            self._write_atomically(cache_path, lambda tmp: pq.write_table(table, tmp))
+        except OSError:
+            pass  # read-only data directory; just skip the cache
+        return table.to_pandas()
+
+    @staticmethod
+    def _write_atomically(path: str, write) -> None:
+        """
+        Call write(tmp_path) on a temporary file next to path, then move it into place.
+
+        Readers see either the previous file or the complete new one, never a
+        partly written file (e.g. from an interrupted or concurrent run).
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
     # ------------------------------------------------------------------
     # Processing
     # ------------------------------------------------------------------
@@ -87,9 +178,18 @@ class EcommerceDataLoader:
 
         Derived columns added
         ---------------------
-        - purchase_year   : int  year extracted from order_purchase_timestamp
-        - purchase_month  : int  month extracted from order_purchase_timestamp
-        - delivery_days   : int  calendar days from purchase to customer delivery
+        - purchase_year   : Int16  year extracted from order_purchase_timestamp
+        - purchase_month  : Int8   month extracted from order_purchase_timestamp
+        - delivery_days   : Int16  calendar days from purchase to customer delivery
+
+        Downcast source columns
+        -----------------------
+        - price, freight_value : float32
+        - review_score         : Int8
+
+        The nullable Int types keep missing timestamps and reviews as NA.
+
+        Also stores the rows with order_status 'delivered' as self.delivered.
 
         Returns
         -------
@@ -105,47 +205,127 @@ class EcommerceDataLoader:
         customers = self.raw['customers']
         reviews  = self.raw['reviews']
 
-        # Merge order items with order header
-        df = items[['order_id', 'order_item_id', 'product_id', 'price', 'freight_value']].merge(
-            orders[['order_id', 'customer_id', 'order_status',
-                    'order_purchase_timestamp', 'order_delivered_customer_date']],
-            on='order_id',
-            how='left',
+        # Dimension tables indexed by their key, so each join probes a prebuilt index
+        order_info = orders.set_index('order_id')[
+            ['customer_id', 'order_status', 'order_purchase_timestamp', 'order_delivered_customer_date']
+        ]
+        product_info = products.set_index('product_id')[['product_category_name']]
+        customer_info = customers.set_index('customer_id')[['customer_state']]
+        # One review score per order (the first non-missing one), already indexed by order_id
+        review_info = reviews.groupby('order_id', sort=False)['review_score'].first()
+
+        # Order items with order header, product category, customer state and review score.
+        # Only columns used downstream are carried; the join keys are dropped afterwards.
+        df = (
+            items[['order_id', 'product_id', 'price', 'freight_value']]
+            .join(order_info, on='order_id')
+            .join(product_info, on='product_id')
+            .join(customer_info, on='customer_id')
+            .join(review_info, on='order_id')
+            .drop(columns=['product_id', 'customer_id'])
         )
 
-        # Attach product category
-        df = df.merge(
-            products[['product_id', 'product_category_name']],
-            on='product_id',
-            how='left',
-        )
+        # Derived time columns
+        df['purchase_year']  = df['order_purchase_timestamp'].dt.year
+        df['purchase_month'] = df['order_purchase_timestamp'].dt.month
 
-        # Attach customer state
-        df = df.merge(
-            customers[['customer_id', 'customer_state', 'customer_city']],
-            on='customer_id',
-            how='left',
+        # Delivery duration in whole days, floor-divided straight from the int64
+        # nanosecond values instead of materialising a timedelta column
+        delivered_ns = df['order_delivered_customer_date'].to_numpy('datetime64[ns]').view(np.int64)
+        purchased_ns = df['order_purchase_timestamp'].to_numpy('datetime64[ns]').view(np.int64)
+        nat = np.iinfo(np.int64).min
+        df['delivery_days'] = pd.arrays.IntegerArray(
+            ((delivered_ns - purchased_ns) // 86_400_000_000_000).astype(np.int16),
+            (delivered_ns == nat) | (purchased_ns == nat),
         )
 
-        # Attach review score (one review per order; drop duplicates before merging)
-        reviews_deduped = (
-            reviews[['order_id', 'review_score']]
-            .drop_duplicates(subset='order_id', keep='first')
-        )
-        df = df.merge(reviews_deduped, on='order_id', how='left')
+        # None of the numeric columns needs 64-bit range: money only needs cent
+        # precision (metric functions sum it in float64) and the integer columns
+        # use nullable dtypes so missing dates and reviews stay NA.
+        df = df.astype({
+            'price':          np.float32,
+            'freight_value':  np.float32,
+            'review_score':   'Int8',
+            'purchase_year':  'Int16',
+            'purchase_month': 'Int8',
+        })
+
+        for col in self.CATEGORY_COLS:
+            df[col] = df[col].astype('category')
+
+        self._set_processed(df)
+        return df
 
-        # Derived time columns
-        df['purchase_year']  = df['order_purchase_timestamp'].dt.year
-        df['purchase_month'] = df['order_purchase_timestamp'].dt.month
+    def process_data_cached(self) -> pd.DataFrame:
+        """
+        process_data(), memoised on disk as Parquet.
 
-        # Delivery duration in calendar days
-        df['delivery_days'] = (
-            df['order_delivered_customer_date'] - df['order_purchase_timestamp']
-        ).dt.days
+        The cache file name is a hash of the CSV names, sizes and modification
+        times plus this module's modification time, so editing either the data
+        or the processing code invalidates it. On a hit the CSVs are not read
+        or merged at all; raw tables are then loaded on first access. Without
+        pyarrow this is just process_data().
 
-        self.processed = df
+        Returns
+        -------
+        pd.DataFrame
+            Fully merged and enriched dataset.
+        """
+        if pa is None:
+            return self.process_data()
+
+        cache_path = self._processed_cache_path()
+        if os.path.exists(cache_path):
+            try:
+                df = pd.read_parquet(cache_path)
+            except (OSError, pa.ArrowInvalid):
+                pass  # truncated or corrupt cache; rebuild and rewrite it
+            else:
+                self._set_processed(df)
+                return df
+
+        df = self.process_data()
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            os.makedirs(cache_dir, exist_ok=True)
+            for stale in glob.glob(os.path.join(cache_dir, 'processed_*.parquet')):
+                if stale != cache_path and os.path.exists(stale):
+                    os.remove(stale)
+            self._write_atomically(
+                cache_path, lambda tmp: df.to_parquet(tmp, compression='zstd', index=False)
+            )
+        except OSError:
+            pass  # read-only data directory; just skip the cache
         return df
 
+    def _processed_cache_path(self) -> str:
+        """Path of the processed-frame Parquet cache for the current CSVs and code."""
+        stats = sorted(
+            (filename, os.path.getmtime(path), os.path.getsize(path))
+            for filename, path in (
+                (f, os.path.join(self.data_path, f)) for f in self.FILES.values()
+            )
+        )
+        stats.append(('data_loader.py', os.path.getmtime(__file__)))
+        key = hashlib.sha1(str(stats).encode()).hexdigest()[:12]
+        return os.path.join(self.data_path, self.PARQUET_CACHE_DIR, f'processed_{key}.parquet')
+
+    def _set_processed(self, df: pd.DataFrame) -> None:
+        """Store the processed frame and its delivered-orders subset."""
+        self.processed = df
+        self.delivered = df[self._status_mask(df, 'delivered')].reset_index(drop=True)
+
+    @staticmethod
+    def _status_mask(df: pd.DataFrame, status: str) -> np.ndarray:
+        """Rows whose order_status is status, compared on the categorical codes."""
+        statuses = df['order_status']
+        if not isinstance(statuses.dtype, pd.CategoricalDtype):
+            return (statuses == status).to_numpy()
+        categories = statuses.cat.categories
+        if status not in categories:
+            return np.zeros(len(df), dtype=bool)
+        return statuses.cat.codes.to_numpy() == categories.get_loc(status)
+
     # ------------------------------------------------------------------
     # Filtered dataset
     # ------------------------------------------------------------------
@@ -178,40 +358,51 @@ class EcommerceDataLoader:
         if self.processed is None:
             self.process_data()
 
-        df = self.processed.copy()
-
-        if status_filter is not None:
-            df = df[df['order_status'] == status_filter]
-        if year_filter is not None:
-            df = df[df['purchase_year'] == year_filter]
-        if month_filter is not None:
-            df = df[df['purchase_month'] == month_filter]
-
+        # Combine the filters into one mask so the frame is sliced at most once
+        if status_filter == 'delivered':
+            df = self.delivered
+            mask = None
+        else:
+            df = self.processed
+            mask = None if status_filter is None else self._status_mask(df, status_filter)
+        for col, value in (('purchase_year', year_filter), ('purchase_month', month_filter)):
+            if value is not None:
+                match = (df[col] == value).to_numpy(dtype=bool, na_value=False)
+                mask = match if mask is None else mask & match
+
+        if mask is not None:
+            df = df[mask]
         return df.reset_index(drop=True)
 
     # ------------------------------------------------------------------
     # Accessors
     # ------------------------------------------------------------------
 
+    def _raw_table(self, key: str) -> pd.DataFrame:
+        """Raw table by name, reading the CSVs first if they have not been loaded yet."""
+        if not self.raw:
+            self.load_raw_data()
+        return self.raw[key]
+
     @property
     def orders(self) -> pd.DataFrame:
         """Raw orders table."""
-        return self.raw.get('orders', pd.DataFrame())
+        return self._raw_table('orders')
 
     @property
     def products(self) -> pd.DataFrame:
         """Raw products table."""
-        return self.raw.get('products', pd.DataFrame())
+        return self._raw_table('products')
 
     @property
     def customers(self) -> pd.DataFrame:
         """Raw customers table."""
-        return self.raw.get('customers', pd.DataFrame())
+        return self._raw_table('customers')
 
     @property
     def reviews(self) -> pd.DataFrame:
         """Raw reviews table."""
-        return self.raw.get('reviews', pd.DataFrame())
+        return self._raw_table('reviews')
 
 
 # ---------------------------------------------------------------------------
@@ -230,7 +421,9 @@ def load_and_process_data(data_path: str) -> tuple[EcommerceDataLoader, pd.DataF
     Returns
     -------
     loader : EcommerceDataLoader
-        Initialised loader instance (raw tables accessible via loader.raw).
+        Initialised loader instance. Raw tables are available via loader.orders,
+        loader.products etc. (read on first access when the processed frame came
+        from the disk cache).
     processed : pd.DataFrame
         Fully merged and enriched dataset.
 
@@ -240,5 +433,5 @@ def load_and_process_data(data_path: str) -> tuple[EcommerceDataLoader, pd.DataF
         sales_2023 = loader.create_sales_dataset(year_filter=2023)
     """
     loader = EcommerceDataLoader(data_path)
-    processed = loader.process_data()
+    processed = loader.process_data_cached()
     return loader, processed